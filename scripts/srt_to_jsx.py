@@ -0,0 +1,219 @@
+#!/usr/bin/env python3
+"""
+SRT -> After Effects JSX converter
+Usage examples:
+  python scripts/srt_to_jsx.py subs.srt              # writes subs_captions.jsx
+  python scripts/srt_to_jsx.py subs.srt out.jsx
+  python scripts/srt_to_jsx.py --force subs.srt      # regenerate even if up to date
+  python scripts/srt_to_jsx.py "episodes/*.srt"      # convert a batch in parallel
+
+The generated script expects a comp to be selected in After Effects and
+adds one styled text layer per caption.
+"""
+
+import glob
+import os
+import re
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from string import Template
+
+# Compiled once at import so repeated conversions skip the re-cache lookup
+# and pattern parse on every call.
+_TIME_RE = re.compile(
+    r'(\d{2}):(\d{2}):(\d{2})[,.](\d{3})\s*-->\s*'
+    r'(\d{2}):(\d{2}):(\d{2})[,.](\d{3})'
+)
+_STAMP_RE = re.compile(r'(\d{2}):(\d{2}):(\d{2})[,.](\d{3})')
+
+# One translate() pass escapes a caption for embedding in a JSX string
+# literal; backslashes are handled by the same pass, so ordering is safe.
+_ESCAPE_TABLE = str.maketrans({'\\': '\\\\', '"': '\\"', '\n': '\\r'})
+
+# The surrounding script only varies in comp name and caption count, so
+# the literal blocks live here instead of being re-interpolated per call.
+_JSX_HEADER = Template('''// $comp_name - generated by CapEdify
+// $count captions
+
+var comp = app.project.activeItem;
+if (comp && comp instanceof CompItem) {
+    var captions = [
+''')
+
+_JSX_FOOTER = '''
+    ];
+
+    // inPoint/outPoint cover the timing; setting startTime as well is
+    // redundant and forces extra recomputation per layer in AE.
+    var captionPos = [comp.width / 2, comp.height - 100];
+
+    // One undo event and no per-layer dialogs/redraws for the whole batch.
+    app.beginUndoGroup("Import Captions");
+    app.beginSuppressDialogs(true);
+    try {
+        for (var i = 0; i < captions.length; i++) {
+            var entry = captions[i];
+            var textLayer = comp.layers.addText(entry.text);
+            textLayer.name = "Caption " + (i + 1);
+            textLayer.inPoint = entry.start;
+            textLayer.outPoint = entry.end;
+
+            var textProp = textLayer.property("Source Text");
+            var textDocument = textProp.value;
+            textDocument.fontSize = 48;
+            textDocument.fillColor = [1, 1, 1];
+            textDocument.strokeColor = [0, 0, 0];
+            textDocument.strokeWidth = 2;
+            textDocument.justification = ParagraphJustification.CENTER_JUSTIFY;
+            textProp.setValue(textDocument);
+
+            textLayer.property("Position").setValue(captionPos);
+        }
+    } finally {
+        app.endUndoGroup();
+        app.endSuppressDialogs(false);
+    }
+
+    alert("Added " + captions.length + " captions!");
+} else {
+    alert("Please select a composition first.");
+}
+'''
+
+
+def parse_srt_time(time_str):
+    """Convert one SRT timestamp (HH:MM:SS,mmm) to seconds."""
+    s = time_str.strip()
+    if len(s) == 12:
+        # Fixed HH:MM:SS,mmm layout: constant-offset slices, no scan.
+        return int(s[0:2]) * 3600 + int(s[3:5]) * 60 + int(s[6:8]) + int(s[9:12]) * 0.001
+    g = _STAMP_RE.fullmatch(s).groups()
+    return int(g[0]) * 3600 + int(g[1]) * 60 + int(g[2]) + int(g[3]) * 0.001
+
+
+def _emit(block, subtitles):
+    """Append one caption block (its non-blank lines) to subtitles."""
+    if len(block) < 3:
+        return
+    match = _TIME_RE.match(block[1])
+    if not match:
+        return
+    g = match.groups()
+    subtitles.append({
+        'start': int(g[0]) * 3600 + int(g[1]) * 60 + int(g[2]) + int(g[3]) * 0.001,
+        'end': int(g[4]) * 3600 + int(g[5]) * 60 + int(g[6]) + int(g[7]) * 0.001,
+        'text': '\n'.join(block[2:]).strip(),
+    })
+
+
+def parse_srt_file(srt_path):
+    """Parse an SRT file into a list of {'start', 'end', 'text'} dicts.
+
+    Streams the file through the buffered line iterator rather than
+    slurping it and regex-splitting, so only one block is held at a time.
+    """
+    subtitles = []
+    block = []
+    with open(srt_path, 'r', encoding='utf-8', buffering=1 << 20) as f:
+        for line in f:
+            line = line.rstrip('\r\n')
+            # Whitespace-only lines count as separators, matching the old
+            # \n\s*\n split; real SRTs often have trailing spaces there.
+            if line.strip():
+                block.append(line)
+            elif block:
+                _emit(block, subtitles)
+                block = []
+    if block:
+        _emit(block, subtitles)
+    return subtitles
+
+
+def iter_jsx(subtitles, comp_name='Captions'):
+    """Yield the JSX source in chunks: header, one chunk per caption, footer.
+
+    Streaming chunks straight to the output file keeps peak memory at one
+    caption's worth of formatting instead of the whole script.
+    """
+    yield _JSX_HEADER.substitute(comp_name=comp_name, count=len(subtitles))
+    # Emit the separator before every entry after the first; no per-entry
+    # "is this the last one" branch or len() lookup needed.
+    sep = ''
+    for sub in subtitles:
+        # Pull the values into fast locals once instead of hashing the
+        # same keys again inside the f-string.
+        s, e, text = sub['start'], sub['end'], sub['text']
+        yield f'{sep}        {{start: {s:.3f}, end: {e:.3f}, text: "{text.translate(_ESCAPE_TABLE)}"}}'
+        sep = ',\n'
+    yield _JSX_FOOTER
+
+
+def generate_jsx(subtitles, comp_name='Captions'):
+    """Build the full JSX source in memory (wrapper around iter_jsx)."""
+    return ''.join(iter_jsx(subtitles, comp_name))
+
+
+def convert_srt_to_jsx(srt_path, jsx_path=None, force=False):
+    """Convert an SRT file to a JSX script. Returns True on success.
+
+    Skips the conversion entirely when the output is already newer than
+    the input (one os.stat each); pass force=True to regenerate anyway.
+    """
+    if jsx_path is None:
+        base, _ = os.path.splitext(srt_path)
+        jsx_path = base + '_captions.jsx'
+
+    if not force and os.path.exists(jsx_path):
+        if os.stat(jsx_path).st_mtime_ns >= os.stat(srt_path).st_mtime_ns:
+            print(f'✅ {jsx_path} is up to date (use --force to regenerate)')
+            return True
+
+    subtitles = parse_srt_file(srt_path)
+    if not subtitles:
+        print('❌ No captions found in', srt_path)
+        return False
+
+    with open(jsx_path, 'w', encoding='utf-8', buffering=1 << 20) as f:
+        f.writelines(iter_jsx(subtitles))
+    print(f'✅ Wrote {len(subtitles)} captions -> {jsx_path}')
+    return True
+
+
+def convert_many(srt_paths, workers=None, force=False):
+    """Convert several SRT files in parallel, one worker process each.
+
+    Parsing and formatting are GIL-bound, so threads would not overlap;
+    a process pool does. Returns True only if every conversion succeeds.
+    """
+    with ProcessPoolExecutor(max_workers=workers or os.cpu_count()) as ex:
+        results = list(ex.map(partial(convert_srt_to_jsx, force=force), srt_paths))
+    return all(results)
+
+
+def main():
+    force = '--force' in sys.argv[1:]
+    args = [a for a in sys.argv[1:] if a != '--force']
+    if not args:
+        print(__doc__)
+        sys.exit(1)
+
+    # Expand glob patterns the shell left alone (quoted, or Windows).
+    if any('*' in a or '?' in a for a in args):
+        expanded = []
+        for a in args:
+            expanded.extend(sorted(glob.glob(a)) or [a])
+        args = expanded
+
+    if len(args) == 2 and not args[1].endswith('.srt'):
+        ok = convert_srt_to_jsx(args[0], args[1], force=force)
+    elif len(args) == 1:
+        ok = convert_srt_to_jsx(args[0], force=force)
+    else:
+        ok = convert_many(args, force=force)
+    if not ok:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,310 @@
+#!/usr/bin/env python3
+"""
+SRT -> After Effects caption script generator
+Usage examples:
+  python scripts/srt_to_jsx_converter.py subs.srt            # writes subs_captions.jsx
+  python scripts/srt_to_jsx_converter.py subs.srt out.jsx
+  python scripts/srt_to_jsx_converter.py --force subs.srt    # regenerate even if up to date
+
+Unlike srt_to_jsx.py this emits a self-contained script that creates its
+own comp and one fully styled text layer per caption, ready for
+File > Scripts > Run Script File in After Effects.
+"""
+
+import os
+import re
+import sys
+from string import Template
+
+# Optional accelerators for very large SRTs; everything below runs without
+# them. Imported independently so a numpy-only install still gets the
+# array timing layout even when numba is missing.
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+# Compiled once at import so repeated conversions skip the re-cache lookup
+# and pattern parse on every call.
+_TIME_RE = re.compile(
+    r'(\d{2}):(\d{2}):(\d{2})[,.](\d{3})\s*-->\s*'
+    r'(\d{2}):(\d{2}):(\d{2})[,.](\d{3})'
+)
+_STAMP_RE = re.compile(r'(\d{2}):(\d{2}):(\d{2})[,.](\d{3})')
+
+# One translate() pass escapes a caption for embedding in a JSX string
+# literal; backslashes are handled by the same pass, so ordering is safe.
+_ESCAPE_TABLE = str.maketrans({'\\': '\\\\', '"': '\\"', '\n': '\\r'})
+_ESC_RE = re.compile(r'["\n\\]')
+_ESC_MAP = {'"': '\\"', '\n': '\\r', '\\': '\\\\'}
+_BLOB_SEP = '\x1f\x1e\x1f'  # never appears in subtitle text
+
+# The surrounding script only varies in comp settings and caption count,
+# so the literal blocks live here instead of being re-interpolated per call.
+_JSX_HEADER = Template('''// After Effects caption script - generated by CapEdify
+// $count captions
+
+var project = app.project ? app.project : app.newProject();
+var comp = project.items.addComp("$comp_name", $width, $height, 1.0, $duration, $fps);
+var captionPos = [$pos_x, $pos_y];
+
+// One undo event and no per-layer dialogs/redraws for the whole batch.
+app.beginUndoGroup("Import Captions");
+app.beginSuppressDialogs(true);
+try {
+''')
+
+_JSX_FOOTER = Template('''
+} finally {
+    app.endUndoGroup();
+    app.endSuppressDialogs(false);
+}
+alert("Created $count caption layers");
+''')
+
+
+def parse_srt_time(time_str):
+    """Convert one SRT timestamp (HH:MM:SS,mmm) to seconds."""
+    s = time_str.strip()
+    if len(s) == 12:
+        # Fixed HH:MM:SS,mmm layout: constant-offset slices, no scan.
+        return int(s[0:2]) * 3600 + int(s[3:5]) * 60 + int(s[6:8]) + int(s[9:12]) * 0.001
+    g = _STAMP_RE.fullmatch(s).groups()
+    return int(g[0]) * 3600 + int(g[1]) * 60 + int(g[2]) + int(g[3]) * 0.001
+
+
+if njit is not None and np is not None:
+    @njit(cache=True)
+    def _parse_times(buf, starts_off, ends_off, out_start, out_end):
+        # ASCII-parse 'HH:MM:SS,mmm' at each offset without Python objects.
+        for i in range(starts_off.shape[0]):
+            a = starts_off[i]
+            b = ends_off[i]
+            out_start[i] = (
+                ((buf[a] - 48) * 10 + (buf[a + 1] - 48)) * 3600
+                + ((buf[a + 3] - 48) * 10 + (buf[a + 4] - 48)) * 60
+                + (buf[a + 6] - 48) * 10 + (buf[a + 7] - 48)
+                + ((buf[a + 9] - 48) * 100 + (buf[a + 10] - 48) * 10 + (buf[a + 11] - 48)) * 0.001
+            )
+            out_end[i] = (
+                ((buf[b] - 48) * 10 + (buf[b + 1] - 48)) * 3600
+                + ((buf[b + 3] - 48) * 10 + (buf[b + 4] - 48)) * 60
+                + (buf[b + 6] - 48) * 10 + (buf[b + 7] - 48)
+                + ((buf[b + 9] - 48) * 100 + (buf[b + 10] - 48) * 10 + (buf[b + 11] - 48)) * 0.001
+            )
+else:
+    _parse_times = None
+
+
+def _valid_stamp(data, o):
+    """True if data[o:o+12] is a well-formed 'HH:MM:SS,mmm' stamp."""
+    s = data[o:o + 12]
+    return (
+        len(s) == 12
+        and s[2:3] == b':' and s[5:6] == b':' and s[8:9] in (b',', b'.')
+        and s[0:2].isdigit() and s[3:5].isdigit()
+        and s[6:8].isdigit() and s[9:12].isdigit()
+    )
+
+
+def _batch_parse_times(data):
+    """Scan the raw buffer for '-->' markers and JIT-parse all timestamps.
+
+    Returns (starts, ends) float64 arrays, or None when the file does not
+    use the canonical 'HH:MM:SS,mmm --> HH:MM:SS,mmm' layout.
+    """
+    offsets = []
+    pos = data.find(b'-->')
+    while pos != -1:
+        # Full layout check before trusting an arrow: the njit kernel does
+        # no bounds or digit checking, so an arrow near EOF or a
+        # nonstandard stamp (e.g. 1-digit hour) must punt to the regex path.
+        if (
+            pos < 13 or pos + 16 > len(data)
+            or data[pos - 1:pos] != b' ' or data[pos + 3:pos + 4] != b' '
+            or not _valid_stamp(data, pos - 13) or not _valid_stamp(data, pos + 4)
+        ):
+            return None
+        offsets.append(pos)
+        pos = data.find(b'-->', pos + 3)
+    if not offsets:
+        return None
+    arrows = np.asarray(offsets, dtype=np.int64)
+    buf = np.frombuffer(data, dtype=np.uint8)
+    starts = np.empty(len(offsets), dtype=np.float64)
+    ends = np.empty(len(offsets), dtype=np.float64)
+    _parse_times(buf, arrows - 13, arrows + 4, starts, ends)
+    return starts, ends
+
+
+def parse_srt_file(srt_path):
+    """Parse an SRT file into parallel (starts, ends, texts) arrays.
+
+    Struct-of-arrays keeps the timing data in two flat float sequences
+    (numpy float64 when available) instead of one dict per caption, which
+    is far lighter for big files. Use to_dicts() to get the old shape.
+    """
+    with open(srt_path, 'rb') as f:
+        data = f.read()
+    # Normalize once so the literal str.split below matches everything the
+    # old \n\s*\n regex split did, while staying on CPython's fast path:
+    # unify line endings, rstrip each line so whitespace-only separator
+    # lines become empty, and collapse blank-line runs to a single blank
+    # line (an odd-length run would otherwise leave the next block with a
+    # leading newline and shift its index/time lines).
+    content = data.decode('utf-8').replace('\r\n', '\n').replace('\r', '\n')
+    content = '\n'.join(line.rstrip() for line in content.split('\n'))
+    while '\n\n\n' in content:
+        content = content.replace('\n\n\n', '\n\n')
+    blocks = content.strip().split('\n\n')
+
+    if _parse_times is not None:
+        times = _batch_parse_times(data)
+        if times is not None:
+            starts, ends = times
+            texts = []
+            for block in blocks:
+                # One maxsplit=2 call replaces the full split, the length
+                # guard, and the '\n'.join of the remaining lines.
+                try:
+                    _idx, time_line, text = block.split('\n', 2)
+                except ValueError:
+                    continue
+                if '-->' not in time_line:
+                    continue
+                if len(texts) >= len(starts):
+                    break
+                texts.append(text.strip())
+            # An arrow inside caption text desyncs the counts; if so,
+            # discard the batch result and take the exact path below.
+            if len(texts) == len(starts):
+                return starts, ends, texts
+
+    starts = []
+    ends = []
+    texts = []
+    for block in blocks:
+        try:
+            _idx, time_line, text = block.split('\n', 2)
+        except ValueError:
+            continue
+        match = _TIME_RE.match(time_line)
+        if not match:
+            continue
+        g = match.groups()
+        starts.append(int(g[0]) * 3600 + int(g[1]) * 60 + int(g[2]) + int(g[3]) * 0.001)
+        ends.append(int(g[4]) * 3600 + int(g[5]) * 60 + int(g[6]) + int(g[7]) * 0.001)
+        texts.append(text.strip())
+    if np is not None:
+        starts = np.asarray(starts, dtype=np.float64)
+        ends = np.asarray(ends, dtype=np.float64)
+    return starts, ends, texts
+
+
+def _escape_texts(texts):
+    """Escape every caption for embedding in JSX string literals.
+
+    Past ~1000 captions it is cheaper to join everything on a sentinel,
+    run one regex substitution over the whole blob, and split back than
+    to dispatch translate() per caption.
+    """
+    if len(texts) < 1000:
+        return [t.translate(_ESCAPE_TABLE) for t in texts]
+    blob = _BLOB_SEP.join(texts)
+    blob = _ESC_RE.sub(lambda m: _ESC_MAP[m.group(0)], blob)
+    return blob.split(_BLOB_SEP)
+
+
+def to_dicts(starts, ends, texts):
+    """Recombine the parallel arrays into the old list-of-dicts shape."""
+    return [
+        {'start': float(s), 'end': float(e), 'text': t}
+        for s, e, t in zip(starts, ends, texts)
+    ]
+
+
+def iter_jsx_script(starts, ends, texts, comp_name='Captions', width=1920, height=1080, fps=29.97):
+    """Yield the JSX script in chunks: header, one chunk per caption, footer.
+
+    Streaming chunks straight to the output file keeps peak memory at one
+    caption's worth of formatting instead of the whole script.
+    """
+    # One C-level reduction when ends is an ndarray; builtin max otherwise.
+    duration = (float(ends.max()) if hasattr(ends, 'max') else max(ends)) + 2.0
+    yield _JSX_HEADER.substitute(
+        count=len(texts), comp_name=comp_name, width=width, height=height,
+        duration=f'{duration:.3f}', fps=fps,
+        pos_x=width / 2, pos_y=height - 100,
+    )
+    escaped = _escape_texts(texts)
+    for i in range(len(texts)):
+        text = escaped[i]
+        yield f'''
+var textLayer{i + 1} = comp.layers.addText("{text}");
+textLayer{i + 1}.name = "Caption {i + 1}";
+textLayer{i + 1}.inPoint = {starts[i]:.3f};
+textLayer{i + 1}.outPoint = {ends[i]:.3f};
+var textProp{i + 1} = textLayer{i + 1}.property("Source Text");
+var textDoc{i + 1} = textProp{i + 1}.value;
+textDoc{i + 1}.fontSize = 48;
+textDoc{i + 1}.font = "Arial-BoldMT";
+textDoc{i + 1}.fillColor = [1, 1, 1];
+textDoc{i + 1}.strokeColor = [0, 0, 0];
+textDoc{i + 1}.strokeWidth = 2;
+textDoc{i + 1}.justification = ParagraphJustification.CENTER_JUSTIFY;
+textProp{i + 1}.setValue(textDoc{i + 1});
+textLayer{i + 1}.property("Position").setValue(captionPos);
+'''
+    yield _JSX_FOOTER.substitute(count=len(texts))
+
+
+def generate_jsx_script(starts, ends, texts, comp_name='Captions', width=1920, height=1080, fps=29.97):
+    """Build the full JSX script in memory (wrapper around iter_jsx_script)."""
+    return ''.join(iter_jsx_script(starts, ends, texts, comp_name, width, height, fps))
+
+
+def convert_srt_to_jsx(srt_path, jsx_path=None, force=False):
+    """Convert an SRT file to a JSX script. Returns True on success.
+
+    Skips the conversion entirely when the output is already newer than
+    the input (one os.stat each); pass force=True to regenerate anyway.
+    """
+    if jsx_path is None:
+        base, _ = os.path.splitext(srt_path)
+        jsx_path = base + '_captions.jsx'
+
+    if not force and os.path.exists(jsx_path):
+        if os.stat(jsx_path).st_mtime_ns >= os.stat(srt_path).st_mtime_ns:
+            print(f'✅ {jsx_path} is up to date (use --force to regenerate)')
+            return True
+
+    starts, ends, texts = parse_srt_file(srt_path)
+    if not texts:
+        print('❌ No captions found in', srt_path)
+        return False
+
+    with open(jsx_path, 'w', encoding='utf-8', buffering=1 << 20) as f:
+        f.writelines(iter_jsx_script(starts, ends, texts))
+    print(f'✅ Wrote {len(texts)} captions -> {jsx_path}')
+    return True
+
+
+def main():
+    force = '--force' in sys.argv[1:]
+    args = [a for a in sys.argv[1:] if a != '--force']
+    if not args:
+        print(__doc__)
+        sys.exit(1)
+    srt_path = args[0]
+    jsx_path = args[1] if len(args) > 1 else None
+    if not convert_srt_to_jsx(srt_path, jsx_path, force=force):
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""
+Regression checks for the SRT parsers in srt_to_jsx.py and
+srt_to_jsx_converter.py.
+Usage:
+  python scripts/test_srt_parsers.py
+"""
+
+import os
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import srt_to_jsx
+import srt_to_jsx_converter
+
+
+def _write_srt(content):
+    f = tempfile.NamedTemporaryFile(
+        'w', suffix='.srt', encoding='utf-8', newline='', delete=False
+    )
+    f.write(content)
+    f.close()
+    return f.name
+
+
+class SeparatorTests(unittest.TestCase):
+    """Blocks must split wherever re.split(r'\\n\\s*\\n') used to split."""
+
+    def _texts(self, content):
+        path = _write_srt(content)
+        try:
+            subs = srt_to_jsx.parse_srt_file(path)
+            _, _, texts = srt_to_jsx_converter.parse_srt_file(path)
+        finally:
+            os.unlink(path)
+        return [s['text'] for s in subs], texts
+
+    def test_multi_blank_line_runs(self):
+        # Odd- and even-length runs of blank lines between blocks.
+        content = (
+            '1\n00:00:01,000 --> 00:00:02,000\nA\n\n\n\n'
+            '2\n00:00:03,000 --> 00:00:04,000\nB\n\n\n\n\n'
+            '3\n00:00:05,000 --> 00:00:06,000\nC\n'
+        )
+        simple, converter = self._texts(content)
+        self.assertEqual(simple, ['A', 'B', 'C'])
+        self.assertEqual(converter, ['A', 'B', 'C'])
+
+    def test_whitespace_only_separator_lines(self):
+        content = (
+            '1\n00:00:01,000 --> 00:00:02,000\nA\n \n'
+            '2\n00:00:03,000 --> 00:00:04,000\nB\n'
+        )
+        simple, converter = self._texts(content)
+        self.assertEqual(simple, ['A', 'B'])
+        self.assertEqual(converter, ['A', 'B'])
+
+    def test_crlf_line_endings(self):
+        content = (
+            '1\r\n00:00:01,000 --> 00:00:02,000\r\nA\r\n\r\n'
+            '2\r\n00:00:03,000 --> 00:00:04,000\r\nB\r\n'
+        )
+        simple, converter = self._texts(content)
+        self.assertEqual(simple, ['A', 'B'])
+        self.assertEqual(converter, ['A', 'B'])
+
+
+if __name__ == '__main__':
+    unittest.main()